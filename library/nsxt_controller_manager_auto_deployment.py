@@ -98,12 +98,12 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible.module_utils._text import to_native
 
-FAILED_STATES = ["UNKNOWN_STATE", "VM_DEPLOYMENT_FAILED", "VM_POWER_ON_FAILED", "VM_ONLINE_FAILED", "VM_CLUSTERING_FAILED",
-                      "VM_DECLUSTER_FAILED", "VM_POWER_OFF_FAILED", "VM_UNDEPLOY_FAILED"]
-IN_PROGRESS_STATES = ["VM_DEPLOYMENT_QUEUED", "VM_DEPLOYMENT_IN_PROGRESS", "VM_POWER_ON_IN_PROGRESS",  "WAITING_TO_REGISTER_VM", "VM_WAITING_TO_CLUSTER",
+FAILED_STATES = frozenset(["UNKNOWN_STATE", "VM_DEPLOYMENT_FAILED", "VM_POWER_ON_FAILED", "VM_ONLINE_FAILED", "VM_CLUSTERING_FAILED",
+                      "VM_DECLUSTER_FAILED", "VM_POWER_OFF_FAILED", "VM_UNDEPLOY_FAILED"])
+IN_PROGRESS_STATES = frozenset(["VM_DEPLOYMENT_QUEUED", "VM_DEPLOYMENT_IN_PROGRESS", "VM_POWER_ON_IN_PROGRESS",  "WAITING_TO_REGISTER_VM", "VM_WAITING_TO_CLUSTER",
                       "VM_WAITING_TO_COME_ONLINE", "VM_CLUSTERING_IN_PROGRESS", "WAITING_TO_UNDEPLOY_VM", "VM_DECLUSTER_IN_PROGRESS",
-                      "VM_POWER_OFF_IN_PROGRESS", "VM_UNDEPLOY_IN_PROGRESS", "VM_UNDEPLOY_SUCCESSFUL"]
-SUCCESS_STATES = ["VM_CLUSTERING_SUCCESSFUL", "VM_DECLUSTER_SUCCESSFUL"]
+                      "VM_POWER_OFF_IN_PROGRESS", "VM_UNDEPLOY_IN_PROGRESS", "VM_UNDEPLOY_SUCCESSFUL"])
+SUCCESS_STATES = frozenset(["VM_CLUSTERING_SUCCESSFUL", "VM_DECLUSTER_SUCCESSFUL"])
 def get_node_params(args=None):
     args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs', 'node_id']
     for key in args_to_remove:
@@ -151,12 +151,14 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
 
 def wait_till_create(vm_id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/cluster/nodes/deployments/%s/status'% vm_id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          if any(resp['status'] in progress_status for progress_status in IN_PROGRESS_STATES):
-              time.sleep(10)
-          elif any(resp['status'] in progress_status for progress_status in SUCCESS_STATES):
+          if resp['status'] in IN_PROGRESS_STATES:
+              time.sleep(min(10, 2 ** count))
+              count = count + 1
+          elif resp['status'] in SUCCESS_STATES:
               time.sleep(5)
               return
           else:
@@ -168,13 +170,14 @@ def wait_till_delete(vm_id, module, manager_url, mgr_username, mgr_password, val
     try:
       count = 0;
       #Wait for maximum 10 minute for vm deletion
-      while True and count < 20:
+      deadline = time.time() + 600
+      while time.time() < deadline:
           (rc, resp) = request(manager_url+ '/cluster/nodes/deployments/%s/status'% vm_id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           if (resp == {}):
               time.sleep(10)
               break
-          time.sleep(30)
+          time.sleep(min(10, 2 ** count))
           count = count + 1
     except Exception as err:
       time.sleep(5)
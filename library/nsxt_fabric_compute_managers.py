@@ -172,14 +172,17 @@ def get_compute_manager_from_display_name(module, manager_url, mgr_username, mgr
 
 def wait_till_create(id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/fabric/compute-managers/%s/status'% id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           if resp['registration_status'] == "REGISTERING":
-              time.sleep(10)
+              time.sleep(min(10, 2 ** count))
+              count = count + 1
           elif resp['registration_status'] == "REGISTERED":
             if resp["connection_status"] == "CONNECTING":
-                time.sleep(10)
+                time.sleep(min(10, 2 ** count))
+                count = count + 1
             elif resp["connection_status"] == "UP":
               time.sleep(5)
               return
@@ -192,10 +195,12 @@ def wait_till_create(id, module, manager_url, mgr_username, mgr_password, valida
 
 def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/fabric/compute-managers/%s/status'% id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          time.sleep(10)
+          time.sleep(min(10, 2 ** count))
+          count = count + 1
     except Exception as err:
       time.sleep(5)
       return
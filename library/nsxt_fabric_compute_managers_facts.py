@@ -39,6 +39,22 @@ options:
         description: The password to authenticate with the NSX manager.
         required: true
         type: str
+    cache_ttl:
+        description: Number of seconds a previously fetched response is served from
+                     the local cache instead of querying the NSX manager again. The
+                     cache is disabled when set to 0. Cached responses are written as
+                     JSON files under ~/.ansible/tmp/nsxt_cache of the user running the
+                     module and persist after the play ends; an entry is removed when
+                     it is next read after expiring or when the request for it fails.
+        required: false
+        type: int
+        default: 0
+    included_fields:
+        description: List of object fields to return. When set, the NSX manager returns
+                     only these fields of each object, which reduces the response size.
+        required: false
+        type: list
+        elements: str
 
 '''
 
@@ -49,19 +65,26 @@ EXAMPLES = '''
       username: "admin"
       password: "Admin!23Admin"
       validate_certs: False
+
+- name: Lists all compute managers, reusing a response fetched in the last 60 seconds
+  nsxt_fabric_compute_managers_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      cache_ttl: 60
 '''
 
 RETURN = '''# '''
 
-import json
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.vmware_nsxt import vmware_argument_spec, request
-from ansible.module_utils.urls import open_url, fetch_url
+from ansible.module_utils.vmware_nsxt import vmware_argument_spec, get_facts, NSXTRequestError
 from ansible.module_utils._text import to_native
-from ansible.module_utils.six.moves.urllib.error import HTTPError
 
 def main():
   argument_spec = vmware_argument_spec()
+  argument_spec.update(cache_ttl=dict(required=False, type='int', default=0),
+                       included_fields=dict(required=False, type='list', elements='str'))
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
@@ -74,8 +97,12 @@ def main():
 
   changed = False
   try:
-    (rc, resp) = request(manager_url+ '/fabric/compute-managers', headers=dict(Accept='application/json'),
-                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+    resp = get_facts(manager_url, [dict(key='compute_managers', path='/fabric/compute-managers')],
+                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
+                    cache_ttl=module.params['cache_ttl'],
+                    included_fields=module.params['included_fields'])['compute_managers']
+  except NSXTRequestError as err:
+    module.fail_json(msg='Error accessing fabric compute manager. NSX returned HTTP %d' % err.status, response=err.response)
   except Exception as err:
     module.fail_json(msg='Error accessing fabric compute manager. Error [%s]' % (to_native(err)))
 
@@ -351,6 +351,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible.module_utils._text import to_native
 
+DEPLOYMENT_PROGRESS = frozenset(['INSTALL_IN_PROGRESS', 'VM_DEPLOYMENT_IN_PROGRESS', 'VM_DEPLOYMENT_QUEUED', 'VM_POWER_ON_IN_PROGRESS', 'NODE_NOT_READY', 'REGISTRATION_PENDING'])
+DEPLOYMENT_SUCCESS = frozenset(['NODE_READY', 'INSTALL_SUCCESSFUL'])
+
 def get_fabric_params(args=None):
     args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
     for key in args_to_remove:
@@ -407,14 +410,14 @@ def check_for_update(module, manager_url, mgr_username, mgr_password, validate_c
     return False
 
 def wait_till_create(id, module, manager_url, mgr_username, mgr_password, validate_certs):
-    DEPLOYMENT_PROGRESS = ['INSTALL_IN_PROGRESS', 'VM_DEPLOYMENT_IN_PROGRESS', 'VM_DEPLOYMENT_QUEUED', 'VM_POWER_ON_IN_PROGRESS', 'NODE_NOT_READY', 'REGISTRATION_PENDING']
-    DEPLOYMENT_SUCCESS = ['NODE_READY', 'INSTALL_SUCCESSFUL']
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/fabric/nodes/%s/status'% id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           if resp['host_node_deployment_status'] in DEPLOYMENT_PROGRESS:
-              time.sleep(10)
+              time.sleep(min(10, 2 ** count))
+              count = count + 1
           elif resp['host_node_deployment_status'] in DEPLOYMENT_SUCCESS:
               time.sleep(5)
               return
@@ -425,10 +428,12 @@ def wait_till_create(id, module, manager_url, mgr_username, mgr_password, valida
 
 def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/fabric/nodes/%s/status'% id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          time.sleep(10)
+          time.sleep(min(10, 2 ** count))
+          count = count + 1
     except Exception as err:
       time.sleep(5)
       return
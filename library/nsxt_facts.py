@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: nsxt_facts
+short_description: Return the List of several NSX objects in one task
+description: Returns information about all objects of each requested type, gathered
+             in a single module invocation instead of one facts task per type.
+version_added: "2.7"
+author: agent
+options:
+    hostname:
+        description: Deployed NSX manager hostname.
+        required: true
+        type: str
+    username:
+        description: The username to authenticate with the NSX manager.
+        required: true
+        type: str
+    password:
+        description: The password to authenticate with the NSX manager.
+        required: true
+        type: str
+    endpoints:
+        description: List of object types to return. Each result is returned under
+                     the key of the same name.
+        required: true
+        type: list
+        elements: str
+        choices: ['compute_collection_fabric_templates', 'compute_collection_transport_templates',
+                  'compute_managers', 'edge_clusters', 'fabric_nodes', 'ip_blocks', 'ip_pools',
+                  'licenses', 'logical_ports', 'logical_router_ports', 'logical_routers',
+                  'logical_switches', 'transport_node_collections', 'transport_node_profiles',
+                  'transport_nodes', 'transport_zones', 'uplink_profiles']
+    cache_ttl:
+        description: Number of seconds a previously fetched response is served from
+                     the local cache instead of querying the NSX manager again. The
+                     cache is disabled when set to 0. Cached responses are written as
+                     JSON files under ~/.ansible/tmp/nsxt_cache of the user running the
+                     module and persist after the play ends; an entry is removed when
+                     it is next read after expiring or when the request for it fails.
+        required: false
+        type: int
+        default: 0
+    concurrency:
+        description: Maximum number of requests sent to the NSX manager in parallel.
+                     Requests are sent one at a time when set to 1.
+        required: false
+        type: int
+        default: 4
+    included_fields:
+        description: List of object fields to return. When set, the NSX manager returns
+                     only these fields of each object, which reduces the response size.
+        required: false
+        type: list
+        elements: str
+
+'''
+
+EXAMPLES = '''
+- name: Lists compute managers and transport zones
+  nsxt_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      endpoints:
+        - compute_managers
+        - transport_zones
+'''
+
+RETURN = '''# '''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.vmware_nsxt import vmware_argument_spec, get_facts, NSXTRequestError
+from ansible.module_utils._text import to_native
+
+FACTS_ENDPOINTS = dict(compute_collection_fabric_templates='/fabric/compute-collection-fabric-templates',
+                       compute_collection_transport_templates='/compute-collection-transport-node-templates',
+                       compute_managers='/fabric/compute-managers',
+                       edge_clusters='/edge-clusters',
+                       fabric_nodes='/fabric/nodes',
+                       ip_blocks='/pools/ip-blocks',
+                       ip_pools='/pools/ip-pools',
+                       licenses='/licenses',
+                       logical_ports='/logical-ports',
+                       logical_router_ports='/logical-router-ports',
+                       logical_routers='/logical-routers',
+                       logical_switches='/logical-switches',
+                       transport_node_collections='/transport-node-collections',
+                       transport_node_profiles='/transport-node-profiles',
+                       transport_nodes='/transport-nodes',
+                       transport_zones='/transport-zones',
+                       uplink_profiles='/host-switch-profiles')
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(endpoints=dict(required=True, type='list', elements='str', choices=sorted(FACTS_ENDPOINTS)),
+                       cache_ttl=dict(required=False, type='int', default=0),
+                       included_fields=dict(required=False, type='list', elements='str'),
+                       concurrency=dict(required=False, type='int', default=4))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+
+  endpoints = [dict(key=key, path=FACTS_ENDPOINTS[key]) for key in module.params['endpoints']]
+
+  changed = False
+  try:
+    resp = get_facts(manager_url, endpoints, url_username=mgr_username, url_password=mgr_password,
+                    validate_certs=validate_certs, cache_ttl=module.params['cache_ttl'],
+                    concurrency=module.params['concurrency'], included_fields=module.params['included_fields'])
+  except NSXTRequestError as err:
+    module.fail_json(msg='Error accessing NSX objects. NSX returned HTTP %d' % err.status, response=err.response)
+  except Exception as err:
+    module.fail_json(msg='Error accessing NSX objects. Error [%s]' % (to_native(err)))
+
+  module.exit_json(changed=changed, **resp)
+if __name__ == '__main__':
+	main()
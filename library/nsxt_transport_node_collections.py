@@ -151,10 +151,12 @@ def get_transport_node_collection_from_display_name(module, manager_url, mgr_use
 
 def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/transport-node-collections/%s'% id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          time.sleep(10)
+          time.sleep(min(10, 2 ** count))
+          count = count + 1
     except Exception as err:
       time.sleep(5)
       return
@@ -120,9 +120,9 @@ from ansible.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible.module_utils._text import to_native
 
 
-FAILED_STATES = ["failed"]
-IN_PROGRESS_STATES = ["pending", "in_progress"]
-SUCCESS_STATES = ["partial_success", "success"]
+FAILED_STATES = frozenset(["failed"])
+IN_PROGRESS_STATES = frozenset(["pending", "in_progress"])
+SUCCESS_STATES = frozenset(["partial_success", "success"])
 
 def get_transport_node_profile_params(args=None):
     args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
@@ -449,9 +449,9 @@ from ansible.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible.module_utils._text import to_native
 
 
-FAILED_STATES = ["failed"]
-IN_PROGRESS_STATES = ["pending", "in_progress"]
-SUCCESS_STATES = ["partial_success", "success"]
+FAILED_STATES = frozenset(["failed"])
+IN_PROGRESS_STATES = frozenset(["pending", "in_progress"])
+SUCCESS_STATES = frozenset(["partial_success", "success"])
 
 def get_transport_node_params(args=None):
     args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
@@ -493,16 +493,17 @@ def get_tn_from_display_name(module, manager_url, mgr_username, mgr_password, va
 def wait_till_create(node_id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
       count = 0;
+      #Wait for max 15 minutes for host to realize
+      deadline = time.time() + 900
       while True:
           (rc, resp) = request(manager_url+ '/transport-nodes/%s/state'% node_id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          if any(resp['state'] in progress_status for progress_status in IN_PROGRESS_STATES):
-              time.sleep(10)
+          if resp['state'] in IN_PROGRESS_STATES:
+              time.sleep(min(10, 2 ** count))
               count = count + 1
-              if count == 90:
-                  #Wait for max 15 minutes for host to realize
+              if time.time() >= deadline:
                   module.fail_json(msg= 'Error creating transport node: %s'%(str(resp['state'])))
-          elif any(resp['state'] in progress_status for progress_status in SUCCESS_STATES):
+          elif resp['state'] in SUCCESS_STATES:
               time.sleep(5)
               return
           else:
@@ -512,10 +513,12 @@ def wait_till_create(node_id, module, manager_url, mgr_username, mgr_password, v
 
 def wait_till_delete(vm_id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
+      count = 0
       while True:
           (rc, resp) = request(manager_url+ '/transport-nodes/%s/state'% vm_id, headers=dict(Accept='application/json'),
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          time.sleep(10)
+          time.sleep(min(10, 2 ** count))
+          count = count + 1
     except Exception as err:
       time.sleep(5)
       return
@@ -11,9 +11,36 @@
 # WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
+import hmac
 import json
+import os
+import stat
+import tempfile
+import time
+import zlib
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils.urls import open_url, fetch_url
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+class NSXTRequestError(Exception):
+    # Raised by request() for HTTP status >= 400; carries the status code and the parsed error body.
+    def __init__(self, status, response):
+        super(NSXTRequestError, self).__init__(status, response)
+        self.status = status
+        self.response = response
+
 def vmware_argument_spec():
     return dict(
         hostname=dict(type='str', required=True),
@@ -23,6 +50,23 @@ def vmware_argument_spec():
         validate_certs=dict(type='bool', requried=False, default=True),
     )
 
+def _decompress(r, raw_data):
+    # open_url does not undo Content-Encoding on the Ansible releases this targets.
+    info = getattr(r, 'info', None)
+    encoding = info().get('Content-Encoding', '') if info else ''
+    if encoding in ('gzip', 'deflate'):
+        try:
+            return zlib.decompress(raw_data, zlib.MAX_WBITS | 32)
+        except zlib.error:
+            pass
+    if encoding == 'deflate':
+        # Some servers send deflate without the zlib wrapper.
+        try:
+            return zlib.decompress(raw_data, -zlib.MAX_WBITS)
+        except zlib.error:
+            pass
+    return raw_data
+
 def request(url, data=None, headers=None, method='GET', use_proxy=True,
             force=False, last_mod_time=None, timeout=300, validate_certs=True,
             url_username=None, url_password=None, http_agent=None, force_basic_auth=True, ignore_errors=False):
@@ -32,25 +76,142 @@ def request(url, data=None, headers=None, method='GET', use_proxy=True,
                      url_username=url_username, url_password=url_password, http_agent=http_agent,
                      force_basic_auth=force_basic_auth)
     except HTTPError as err:
-        r = err.fp
+        # Keep the HTTPError itself; err.fp is closed once the except block ends on Python 3.
+        r = err
 
+    resp_code = r.getcode()
+    resp_data = None
     try:
         raw_data = r.read()
         if raw_data:
-            data = json.loads(raw_data)
+            raw_data = _decompress(r, raw_data)
+            resp_data = orjson.loads(raw_data) if HAS_ORJSON else json.loads(raw_data)
         else:
             raw_data = None
     except:
-        if ignore_errors:
+        if ignore_errors or resp_code >= 400:
             pass
         else:
             raise Exception(raw_data)
 
-    resp_code = r.getcode()
-
     if resp_code >= 400 and not ignore_errors:
-        raise Exception(resp_code, data)
-    if not (data is None) and data.__contains__('error_code'):
-        raise Exception (data['error_code'], data)
+        raise NSXTRequestError(resp_code, resp_data)
+    if not (resp_data is None) and resp_data.__contains__('error_code'):
+        raise Exception (resp_data['error_code'], resp_data)
     else:
-        return resp_code, data
+        return resp_code, resp_data
+
+def _cache_dir():
+    # Per-user cache directory; refuse it unless it is a private directory owned by us.
+    cache_dir = os.path.join(os.path.expanduser('~'), '.ansible', 'tmp', 'nsxt_cache')
+    try:
+        os.makedirs(cache_dir, 0o700)
+    except OSError:
+        if not os.path.isdir(cache_dir):
+            raise
+    st = os.lstat(cache_dir)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise OSError('Refusing to use insecure cache directory %s' % cache_dir)
+    return cache_dir
+
+def _cache_key(url, url_username, url_password):
+    return hmac.new(to_bytes(url_password or ''), to_bytes('%s|%s' % (url, url_username)), hashlib.sha256).hexdigest()
+
+def _read_cache(cache_file, cache_ttl):
+    fd = os.open(cache_file, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    with os.fdopen(fd) as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid():
+            return None
+        if time.time() - st.st_mtime >= cache_ttl:
+            _drop_cache(cache_file)
+            return None
+        return json.load(f)
+
+def _write_cache(cache_dir, cache_file, data):
+    fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.rename(tmp_file, cache_file)
+    except Exception:
+        os.remove(tmp_file)
+        raise
+
+def _drop_cache(cache_file):
+    try:
+        os.remove(cache_file)
+    except OSError:
+        pass
+
+def cached_request(url, cache_ttl=0, url_username=None, url_password=None, loader=request, **kwargs):
+    # Serve idempotent GETs from a short lived on-disk cache. Disabled when cache_ttl is 0.
+    # loader performs the actual fetch and must return (resp_code, data) like request().
+    if not cache_ttl:
+        return loader(url, url_username=url_username, url_password=url_password, **kwargs)
+    try:
+        cache_dir = _cache_dir()
+    except (IOError, OSError):
+        return loader(url, url_username=url_username, url_password=url_password, **kwargs)
+    cache_file = os.path.join(cache_dir, _cache_key(url, url_username, url_password) + '.json')
+    try:
+        data = _read_cache(cache_file, cache_ttl)
+        if data is not None:
+            return 200, data
+    except (IOError, OSError, ValueError):
+        pass
+
+    try:
+        resp_code, data = loader(url, url_username=url_username, url_password=url_password, **kwargs)
+    except Exception:
+        _drop_cache(cache_file)
+        raise
+    if resp_code == 200 and data is not None:
+        try:
+            _write_cache(cache_dir, cache_file, data)
+        except (IOError, OSError):
+            pass
+    else:
+        _drop_cache(cache_file)
+    return resp_code, data
+
+MAX_PAGES = 1000
+
+def _request_all_pages(url, **kwargs):
+    # List APIs return one page per call; the cursor is opaque, so pages are followed in order.
+    # Stop on a repeated cursor or an empty page so a shrinking or filtered list cannot loop forever.
+    (resp_code, resp) = request(url, **kwargs)
+    page = resp
+    seen_cursors = set()
+    while isinstance(page, dict) and page.get('cursor') and page['cursor'] not in seen_cursors and \
+            'results' in resp and len(resp['results']) < resp.get('result_count', 0) and \
+            len(seen_cursors) < MAX_PAGES:
+        seen_cursors.add(page['cursor'])
+        page_url = url + ('&' if '?' in url else '?') + 'cursor=' + quote(page['cursor'])
+        (rc, page) = request(page_url, **kwargs)
+        page_results = (page or {}).get('results') or []
+        if not page_results:
+            break
+        resp['results'].extend(page_results)
+    if isinstance(resp, dict):
+        resp.pop('cursor', None)
+    return resp_code, resp
+
+def get_facts(manager_url, endpoints, url_username=None, url_password=None, validate_certs=True, cache_ttl=0, concurrency=1,
+              included_fields=None):
+    # endpoints is a list of dict(key=..., path=...); returns the response body of each path under its key.
+    # The GETs are independent, so up to concurrency of them are issued in parallel.
+    # Only the merged envelope of each endpoint is cached, never individual cursor pages.
+    # An HTTP error on any of them is raised instead of being returned as a fact.
+    query = '?included_fields=' + quote(','.join(included_fields), safe=',') if included_fields else ''
+    headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+    def fetch(endpoint):
+        (rc, resp) = cached_request(manager_url + endpoint['path'] + query, cache_ttl=cache_ttl, loader=_request_all_pages,
+                        headers=headers, url_username=url_username, url_password=url_password, validate_certs=validate_certs)
+        return resp
+
+    if not HAS_FUTURES or concurrency <= 1 or len(endpoints) <= 1:
+        return dict((endpoint['key'], fetch(endpoint)) for endpoint in endpoints)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(endpoints))) as executor:
+        responses = executor.map(fetch, endpoints)
+        return dict((endpoint['key'], resp) for endpoint, resp in zip(endpoints, responses))